@@ -17,32 +17,21 @@ if not hasattr(st.session_state, 'schema_loaded'):
     status_placeholder.info('🔄 Loading database schema... Please wait.')
     
     # Import retrieve_schema to access schema loading functions
-    from retrieve_schema import boto3_clients, get_database_tables_via_athena, describe_table_via_athena, DATABASE
+    from retrieve_schema import boto3_clients, get_database_schema_via_athena, DATABASE
     
     try:
         # Initialize Athena client
         athena_client, _ = boto3_clients()
         
-        # Get list of tables
-        status_placeholder.info('📋 Retrieving table list...')
-        tables = get_database_tables_via_athena(athena_client, database=DATABASE)
+        # Load every table's columns in one pass; a recent on-disk copy is reused across restarts
+        status_placeholder.info('📋 Retrieving database schema...')
+        schema = get_database_schema_via_athena(athena_client, database=DATABASE)
+        total_tables = len(schema)
         
-        # Create schema dictionary
-        schema = {}
-        total_tables = len(tables)
-        
-        # Stream table information as it loads
-        for idx, table in enumerate(tables, 1):
-            status_placeholder.info(f'📊 Loading table {idx}/{total_tables}: **{table}**')
+        # Report each table as it is listed
+        for idx, (table, columns) in enumerate(schema.items(), 1):
+            status_placeholder.info(f'📊 Loaded table {idx}/{total_tables}: **{table}** ({len(columns)} columns)')
             progress_placeholder.progress(idx / total_tables)
-            
-            try:
-                columns = describe_table_via_athena(athena_client, table, database=DATABASE)
-                schema[table] = columns
-                status_placeholder.success(f'✓ Loaded **{table}**: {len(columns)} columns')
-            except Exception as e:
-                schema[table] = {"error": str(e)}
-                status_placeholder.warning(f'⚠️ Error loading **{table}**: {str(e)}')
         
         # Store schema in prompt module
         import prompt
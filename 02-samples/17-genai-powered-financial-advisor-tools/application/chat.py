@@ -462,12 +462,9 @@ def knowledge_bases_agent(query: str) -> str:
 
         logger.info(f"kb_tools: {kb_tools}")
 
-        kb_system_prompt = """
-            Specialized agent for returning list of Bedrock Knowledge Bases
-            """
         model = get_model()
 
-        kb_agent = Agent(name="knowledge_bases_agent", model=model, system_prompt=kb_system_prompt, tools=kb_tools)
+        kb_agent = Agent(name="knowledge_bases_agent", model=model, system_prompt=prompt.knowledge_base_prompt, tools=kb_tools)
 
         response = kb_agent(query)
         return str(response)
@@ -1069,7 +1066,7 @@ def triage_query(question, history_mode, st):
 
                 try:
                     response_text = str(triage_response)
-                    if response_text == "graph":
+                    if response_text == prompt.GRAPH:
                         agent = create_graph_agent()
                     else:
                         agent = create_qna_agent()
@@ -1265,7 +1262,7 @@ def create_graph_agent(system_prompt: str = None):
     graph_database_query_agent = Agent(name="graph_database_analyst", model=get_model(), system_prompt=db_prompt, tools=[database_query_agent])
     graph_market_search_agent = Agent(name="graph_market_researcher", model=get_model(), system_prompt=prompt.market_search_prompt, tools=[market_search_agent])
     synthesis_agent = Agent(name="graph_synthesizer", model=get_model(),system_prompt=prompt.synthesis_prompt)
-    report_writer_agent = Agent(name="graph_report_writer", model=get_model(),system_prompt="Create a report using generate_pdf_report tool", tools=[generate_pdf_report])
+    report_writer_agent = Agent(name="graph_report_writer", model=get_model(),system_prompt=prompt.report_writer_prompt, tools=[generate_pdf_report])
 
     try:
         # Build the graph
@@ -7,14 +7,19 @@ Used by chat.py to load schema at application startup.
 """
 
 import os
+import functools
+import json
+import random
+import tempfile
 import time
 import yaml
 import logging
 import sys
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 
 import boto3
+from botocore.config import Config
 
 # Initialize logging
 logging.basicConfig(
@@ -25,6 +30,7 @@ logging.basicConfig(
 logger = logging.getLogger("athena_schema")
 
 # Load configuration
+@functools.lru_cache(maxsize=1)
 def load_config():
     """Load configuration from prereqs_config.yaml"""
     config_path = Path(__file__).parent / "prerequisites" / "prereqs_config.yaml"
@@ -35,8 +41,6 @@ def load_config():
         logger.warning(f"⚠️ Could not load config: {e}")
         return {}
 
-config = load_config()
-
 # Validate required configuration
 def validate_config(config: dict) -> None:
     """Validate that required configuration values are present"""
@@ -62,35 +66,80 @@ def validate_config(config: dict) -> None:
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-# Validate configuration before proceeding
-validate_config(config)
+@functools.lru_cache(maxsize=1)
+def load_settings() -> Dict[str, str]:
+    """Load and validate the configuration, then derive the constants that depend on it"""
+    config = load_config()
+    validate_config(config)
+    s3_bucket = config.get("s3_bucket_name_for_athena", "")
+    return {
+        "AWS_REGION": os.environ.get("AWS_REGION", config.get("region_name", "us-west-2")),
+        "S3_BUCKET_ATHENA": s3_bucket,
+        "S3_OUTPUT": os.environ.get("S3_OUTPUT", f"s3://{s3_bucket}/"),
+        "DATABASE": config.get("database_name", ""),
+    }
+
+
+_SETTING_NAMES = frozenset({"AWS_REGION", "S3_BUCKET_ATHENA", "S3_OUTPUT", "DATABASE"})
+
+
+def __getattr__(name: str):
+    """
+    Resolve config, AWS_REGION, S3_BUCKET_ATHENA, S3_OUTPUT and DATABASE on first
+    access, so importing this module does not read or validate the config file.
+    """
+    if name == "config":
+        return load_config()
+    if name in _SETTING_NAMES:
+        return load_settings()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Configuration constants
-AWS_REGION = os.environ.get("AWS_REGION", config.get("region_name", "us-west-2"))
-S3_BUCKET_ATHENA = config.get("s3_bucket_name_for_athena", "")
-S3_OUTPUT = os.environ.get("S3_OUTPUT", f"s3://{S3_BUCKET_ATHENA}/")
-DATABASE = config.get("database_name", "")
 ATHENA_WORKGROUP = os.environ.get("ATHENA_WORKGROUP")
-POLL_INTERVAL_SECONDS = 1
+POLL_INTERVAL_SECONDS = 0.05
+POLL_MAX_INTERVAL_SECONDS = 2
+ATHENA_CATALOG = os.environ.get("ATHENA_CATALOG", "AwsDataCatalog")
+SCHEMA_CACHE_DIR = Path(os.environ.get("SCHEMA_CACHE_DIR", Path.home() / ".cache" / "fa_db_schema"))
+SCHEMA_TTL_SECONDS = int(os.environ.get("SCHEMA_TTL_SECONDS", "3600"))
+ATHENA_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 10},
+)
 
 # Module-level schema cache
 fa_db_schema = None
 
 
-def boto3_clients(region_name: str = AWS_REGION):
-    """Create and return Athena client (Glue not needed for schema retrieval)"""
-    athena = boto3.client("athena", region_name=region_name)
-    return athena, None  # Return tuple for backward compatibility
+@functools.lru_cache(maxsize=1)
+def boto3_session():
+    """Return the boto3 session shared by every client in this module"""
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def athena_client_for_region(region_name: str):
+    """Return the shared, connection-pooled Athena client for a region"""
+    return boto3_session().client("athena", region_name=region_name, config=ATHENA_CLIENT_CONFIG)
+
+
+def boto3_clients(region_name: Optional[str] = None):
+    """Return the shared Athena client (Glue not needed for schema retrieval)"""
+    if region_name is None:
+        region_name = load_settings()["AWS_REGION"]
+    return athena_client_for_region(region_name), None  # Return tuple for backward compatibility
 
 def start_and_wait_athena_query(
     athena_client,
     query_str: str,
     database: str,
-    s3_output: str = S3_OUTPUT,
+    s3_output: Optional[str] = None,
     workgroup: Optional[str] = ATHENA_WORKGROUP,
     poll_interval: float = POLL_INTERVAL_SECONDS,
 ) -> Dict[str, Any]:
     """Execute an Athena query and wait for completion"""
+    if s3_output is None:
+        s3_output = load_settings()["S3_OUTPUT"]
     params = {
         "QueryString": query_str,
         "QueryExecutionContext": {"Database": database},
@@ -102,89 +151,182 @@ def start_and_wait_athena_query(
     resp = athena_client.start_query_execution(**params)
     query_execution_id = resp["QueryExecutionId"]
 
+    # Metadata queries usually finish in well under a second, so polling starts
+    # fast and backs off (with jitter) to keep long queries from using up the
+    # GetQueryExecution rate limit
     while True:
         qe = athena_client.get_query_execution(QueryExecutionId=query_execution_id)
         state = qe["QueryExecution"]["Status"]["State"]
         if state in ("SUCCEEDED", "FAILED", "CANCELLED"):
             return {"QueryExecutionId": query_execution_id, "QueryExecution": qe["QueryExecution"]}
-        time.sleep(poll_interval)
+        time.sleep(poll_interval + random.uniform(0, poll_interval * 0.1))
+        poll_interval = min(poll_interval * 2, POLL_MAX_INTERVAL_SECONDS)
 
 
-def fetch_query_results(athena_client, query_execution_id: str, max_pages: int = 100) -> List[List[str]]:
-    """Fetch results from a completed Athena query"""
-    rows_out = []
+def fetch_query_results(
+    athena_client,
+    query_execution_id: str,
+    max_pages: int = 100,
+    max_rows: Optional[int] = None,
+) -> Iterator[List[str]]:
+    """Yield the rows of a completed Athena query as each page arrives, stopping after max_rows"""
+    page_size = 1000 if max_rows is None else min(1000, max_rows)
     next_token = None
     pages = 0
+    rows_out = 0
     while True:
-        args = {"QueryExecutionId": query_execution_id}
+        args = {"QueryExecutionId": query_execution_id, "MaxResults": page_size}
         if next_token:
             args["NextToken"] = next_token
         resp = athena_client.get_query_results(**args)
         for r in resp.get("ResultSet", {}).get("Rows", []):
-            data = [col.get("VarCharValue", "") for col in r.get("Data", [])]
-            rows_out.append(data)
+            if max_rows is not None and rows_out >= max_rows:
+                return
+            yield [col.get("VarCharValue", "") for col in r["Data"]]
+            rows_out += 1
         next_token = resp.get("NextToken")
         pages += 1
         if not next_token or pages >= max_pages:
             break
-    return rows_out
+        if max_rows is not None and rows_out >= max_rows:
+            break
 
 
-def query_to_table_rows(athena_client, sql: str, database: str = DATABASE) -> List[List[str]]:
-    """Execute a query and return results as rows"""
+def query_to_table_rows(
+    athena_client,
+    sql: str,
+    database: Optional[str] = None,
+    max_rows: Optional[int] = None,
+) -> Iterator[List[str]]:
+    """Execute a query and return an iterator over its result rows"""
+    if database is None:
+        database = load_settings()["DATABASE"]
     started = start_and_wait_athena_query(athena_client, sql, database)
     qid = started["QueryExecutionId"]
     state = started["QueryExecution"]["Status"]["State"]
     if state != "SUCCEEDED":
         reason = started["QueryExecution"]["Status"].get("StateChangeReason", "<no reason>")
         raise RuntimeError(f"Athena query {qid} failed: {state} - {reason}")
-    rows = fetch_query_results(athena_client, qid)
-    return rows
+    return fetch_query_results(athena_client, qid, max_rows=max_rows)
+
 
+def table_metadata_columns(table_metadata: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Convert Athena table metadata into column information, partition keys last"""
+    return [
+        {"name": col["Name"], "type": col.get("Type", ""), "comment": col.get("Comment", "")}
+        for col in table_metadata.get("Columns", []) + table_metadata.get("PartitionKeys", [])
+    ]
 
-def get_database_tables_via_athena(athena_client, database: str = DATABASE) -> List[str]:
+
+def iter_table_metadata(athena_client, database: Optional[str] = None):
+    """Yield the catalog metadata of every table in the database, page by page"""
+    if database is None:
+        database = load_settings()["DATABASE"]
+    paginator = athena_client.get_paginator("list_table_metadata")
+    for page in paginator.paginate(CatalogName=ATHENA_CATALOG, DatabaseName=database):
+        yield from page.get("TableMetadataList", [])
+
+
+def get_database_tables_via_athena(athena_client, database: Optional[str] = None) -> List[str]:
     """Get list of tables in the database"""
-    rows = query_to_table_rows(athena_client, "SHOW TABLES", database=database)
-    tables = []
-    for row in rows:
-        if not row:
-            continue
-        candidate = row[0].strip()
-        if candidate and "table" not in candidate.lower():
-            tables.append(candidate)
-    return list(dict.fromkeys(tables))
+    if database is None:
+        database = load_settings()["DATABASE"]
+    return [table["Name"] for table in iter_table_metadata(athena_client, database=database)]
 
 
-def describe_table_via_athena(athena_client, table_name: str, database: str = DATABASE) -> List[Dict[str, str]]:
+def describe_table_via_athena(athena_client, table_name: str, database: Optional[str] = None) -> List[Dict[str, str]]:
     """Get column information for a specific table"""
-    rows = query_to_table_rows(athena_client, f"DESCRIBE {table_name}", database=database)
-    result = []
+    if database is None:
+        database = load_settings()["DATABASE"]
+    # Catalog metadata comes from a control-plane call: no query to run,
+    # poll or pay for
+    resp = athena_client.get_table_metadata(
+        CatalogName=ATHENA_CATALOG, DatabaseName=database, Name=table_name
+    )
+    return table_metadata_columns(resp["TableMetadata"])
+
+
+def get_database_schema_via_table_metadata(athena_client, database: Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
+    """Get column information for every table in the database from the catalog"""
+    if database is None:
+        database = load_settings()["DATABASE"]
+    return {
+        table["Name"]: table_metadata_columns(table)
+        for table in iter_table_metadata(athena_client, database=database)
+    }
+
+
+def get_database_schema_via_information_schema(athena_client, database: Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
+    """Get column information for every table in the database with a single query"""
+    if database is None:
+        database = load_settings()["DATABASE"]
+    escaped_database = database.replace("'", "''")
+    sql = (
+        "SELECT table_name, column_name, data_type, comment "
+        "FROM information_schema.columns "
+        f"WHERE table_schema = '{escaped_database}' "
+        "ORDER BY table_name, ordinal_position"
+    )
+    rows = query_to_table_rows(athena_client, sql, database=database)
+    schema = {}
+    # The first row holds the column headers
+    next(rows, None)
     for row in rows:
-        if not row:
-            continue
-        if any(h.lower() in ("col_name", "name", "column") for h in row):
-            continue
-        col_name = row[0].strip() if len(row) > 0 else ""
-        col_type = row[1].strip() if len(row) > 1 else ""
-        col_comment = row[2].strip() if len(row) > 2 else ""
-        if col_name:
-            result.append({"name": col_name, "type": col_type, "comment": col_comment})
-    return result
-
-
-def get_database_schema_via_athena(athena_client, database: str = DATABASE) -> Dict[str, Any]:
+        table_name, col_name, col_type, col_comment = (row + ["", "", "", ""])[:4]
+        schema.setdefault(table_name, []).append({"name": col_name, "type": col_type, "comment": col_comment})
+    return schema
+
+
+def schema_cache_path(database: str) -> Path:
+    """Location of the on-disk schema cache for a database"""
+    return SCHEMA_CACHE_DIR / f"{ATHENA_CATALOG}.{database}.json"
+
+
+def load_cached_schema(database: str) -> Optional[Dict[str, Any]]:
+    """Return the cached schema for a database, or None if missing or older than the TTL"""
+    path = schema_cache_path(database)
+    try:
+        if time.time() - path.stat().st_mtime > SCHEMA_TTL_SECONDS:
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_schema(database: str, schema: Dict[str, Any]) -> None:
+    """Write the schema cache atomically so concurrent readers never see a partial file"""
+    try:
+        SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=SCHEMA_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(schema, f)
+            os.replace(tmp_path, schema_cache_path(database))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write schema cache: {e}")
+
+
+def get_database_schema_via_athena(athena_client, database: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
     """
     Get complete schema for all tables in the database.
     
     Args:
         athena_client: Boto3 Athena client
         database: Database name
+        use_cache: Reuse a schema cached on disk within SCHEMA_TTL_SECONDS
         
     Returns:
         Dictionary mapping table names to column information
     """
     global fa_db_schema
     
+    if database is None:
+        database = load_settings()["DATABASE"]
+    
     # Validate database parameter
     if not database or not database.strip():
         error_msg = (
@@ -195,18 +337,29 @@ def get_database_schema_via_athena(athena_client, database: str = DATABASE) -> D
         logger.error(error_msg)
         raise ValueError(error_msg)
     
-    schema = {}
-    tables = get_database_tables_via_athena(athena_client, database=database)
-    logger.info(f"📊 Found {len(tables)} tables in database '{database}'")
+    # The schema rarely changes between restarts, so a recent copy on disk
+    # saves the catalog round trips at startup
+    if use_cache:
+        schema = load_cached_schema(database)
+        if schema:
+            logger.info(f"📊 Loaded schema for {len(schema)} tables in database '{database}' from cache")
+            fa_db_schema = schema
+            return schema
     
-    for table in tables:
-        try:
-            columns = describe_table_via_athena(athena_client, table, database=database)
-            schema[table] = columns
-            logger.info(f"  ✓ {table}: {len(columns)} columns")
-        except Exception as e:
-            schema[table] = {"error": str(e)}
-            logger.error(f"  ✗ {table}: {str(e)}")
+    # The catalog lists every table with its columns in a few free API calls;
+    # without permission for it, one information_schema query does the same
+    try:
+        schema = get_database_schema_via_table_metadata(athena_client, database=database)
+    except Exception as e:
+        logger.warning(f"⚠️ Table metadata unavailable, querying information_schema instead: {e}")
+        schema = get_database_schema_via_information_schema(athena_client, database=database)
+    
+    logger.info(f"📊 Found {len(schema)} tables in database '{database}'")
+    for table, columns in schema.items():
+        logger.info(f"  ✓ {table}: {len(columns)} columns")
+    
+    if use_cache and schema:
+        save_cached_schema(database, schema)
     
     # Update module-level cache
     fa_db_schema = schema
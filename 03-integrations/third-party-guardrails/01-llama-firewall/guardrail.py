@@ -8,13 +8,50 @@ Valid roles are `user` and `assistant`.
 https://docs.aws.amazon.com/bedrock/latest/APIReference/API_runtime_Message.html
 """
 from strands.hooks import HookProvider, HookRegistry, MessageAddedEvent
-from typing import Dict,Any
+from typing import Dict, Any, Iterable, Iterator
+from collections import OrderedDict
 import asyncio
-from llamafirewall import LlamaFirewall, UserMessage, AssistantMessage, Role, ScannerType
+import concurrent.futures
+import hashlib
+import re
+import threading
+
+
+# Number of scan decisions kept for repeated message content
+DECISION_CACHE_SIZE = 4096
+# Seconds to wait for a single LlamaFirewall scan
+SCAN_TIMEOUT_SECONDS = 30
+# Messages shorter than this are too short to carry an injection or code, so they are not scanned
+MIN_SCAN_LENGTH = 4
+# Trivial replies that are allowed without running the scanners
+TRIVIAL_MESSAGE_PATTERN = re.compile(r"^(hi|hello|hey|thanks|thank you|ok|yes|no)[.!?]*$", re.IGNORECASE)
+
+
+def iter_message_text(content_blocks: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the text of each content block, including text inside tool results."""
+    for block in content_blocks:
+        text = block.get('text')
+        if text is not None:
+            yield text
+        elif 'toolResult' in block:
+            for content in block['toolResult'].get('content', ()):
+                text = content.get('text')
+                if text is not None:
+                    yield text
 
 
 class CustomGuardrailHook(HookProvider):
     def __init__(self):
+        # Imported here so importing this module does not load the scanner models
+        from llamafirewall import LlamaFirewall, Role, ScannerType
+
+        # LRU of scan decisions keyed by (role, content digest)
+        self._decision_cache = OrderedDict()
+        self._decision_cache_lock = threading.Lock()
+
+        # One event loop on a background thread runs every async scan for the lifetime of the hook
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="llamafirewall-loop", daemon=True).start()
              
         # Configure LlamaFirewall with multiple scanners for comprehensive protection
         self.firewall = LlamaFirewall(
@@ -40,23 +77,31 @@ class CustomGuardrailHook(HookProvider):
 
     def extract_text_from_message(self, message: Dict[str, Any]) -> str:
         """Extract text content from a Bedrock Message object."""
-        content_blocks = message.get('content', [])
-        text_parts = []
-        
-        for block in content_blocks:
-            if 'text' in block:
-                text_parts.append(block['text'])
-            elif 'toolResult' in block:
-                tool_result = block['toolResult']
-                if 'content' in tool_result:
-                    for content in tool_result['content']:
-                        if 'text' in content:
-                            text_parts.append(content['text'])
-        
-        return ' '.join(text_parts)
+        return ' '.join(iter_message_text(message.get('content', [])))
 
     def check_with_llama_firewall(self, text: str, role: str) -> Dict[str, Any]:
-        """Check text content using LlamaFirewall."""
+        """Check text content using LlamaFirewall, reusing the decision for content already scanned."""
+        key = (role, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+        with self._decision_cache_lock:
+            cached = self._decision_cache.get(key)
+            if cached is not None:
+                self._decision_cache.move_to_end(key)
+                return {**cached, 'cache_hit': True}
+
+        result = self.scan_with_llama_firewall(text, role)
+
+        # Failed scans are not cached so a transient error does not keep blocking the content
+        if 'error' not in result:
+            with self._decision_cache_lock:
+                self._decision_cache[key] = result
+                if len(self._decision_cache) > DECISION_CACHE_SIZE:
+                    self._decision_cache.popitem(last=False)
+        return {**result, 'cache_hit': False}
+
+    def scan_with_llama_firewall(self, text: str, role: str) -> Dict[str, Any]:
+        """Scan text content using LlamaFirewall."""
+        from llamafirewall import UserMessage, AssistantMessage
+
         try:
             # Create appropriate message object based on role
             if role == 'user':
@@ -68,15 +113,13 @@ class CustomGuardrailHook(HookProvider):
                 message = UserMessage(content=text)
             
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Create new event loop in thread if one is already running
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, self.firewall.scan_async(message))
-                        result = future.result()
-                else:
-                    result = asyncio.run(self.firewall.scan_async(message))
+                future = asyncio.run_coroutine_threadsafe(self.firewall.scan_async(message), self._loop)
+                try:
+                    result = future.result(timeout=SCAN_TIMEOUT_SECONDS)
+                except concurrent.futures.TimeoutError:
+                    # Stop the hung scan so it does not keep occupying the shared loop
+                    future.cancel()
+                    raise
             except AttributeError:
                 # Fallback to sync method if async not available
                 result = self.firewall.scan(message)
@@ -113,9 +156,13 @@ class CustomGuardrailHook(HookProvider):
         role = newest_message.get('role', 'unknown')
         text_content = self.extract_text_from_message(newest_message)
         
-        if not text_content.strip():
+        stripped_text = text_content.strip()
+        if not stripped_text:
             print(f"No text content found in {role} message")
             return
+        if len(stripped_text) < MIN_SCAN_LENGTH or TRIVIAL_MESSAGE_PATTERN.match(stripped_text):
+            print(f"✅ {role} message is trivial, skipping guardrail check")
+            return
         
         print(f"Checking {role} message with LlamaFirewall...")
         print(f"Content preview: {text_content[:100]}...")
@@ -134,6 +181,8 @@ class CustomGuardrailHook(HookProvider):
             raise Exception(f"Message blocked by guardrail: {guard_result.get('reason', 'Security violation detected')}")
         else:
             print(f"✅ {role} message passed guardrail check")
+            if guard_result.get('cache_hit'):
+                print("  (cached decision)")
             print(f"  Score: {guard_result.get('score', 0.0)}")
             print(f"  Status: {guard_result.get('status', 'SUCCESS')}")
             
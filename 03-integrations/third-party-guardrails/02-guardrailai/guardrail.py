@@ -5,14 +5,32 @@ Defines a custom hook for plugging into third-party guardrails tools.
 Blocks toxic language from the hub://guardrails/toxic_language guardrail
 """
 from strands.hooks import HookProvider, HookRegistry, MessageAddedEvent
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator
+import re
 
-from guardrails.hub import ToxicLanguage
-from guardrails import Guard
+# Trivial replies that are allowed without running the toxicity model
+TRIVIAL_MESSAGE_PATTERN = re.compile(r"^(hi|hello|hey|thanks|thank you|ok|yes|no)[.!?]*$", re.IGNORECASE)
+
+
+def iter_message_text(content_blocks: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the text of each content block, including text inside tool results."""
+    for block in content_blocks:
+        text = block.get('text')
+        if text is not None:
+            yield text
+        elif 'toolResult' in block:
+            for content in block['toolResult'].get('content', ()):
+                text = content.get('text')
+                if text is not None:
+                    yield text
 
 
 class CustomGuardrailHook(HookProvider):
     def __init__(self):
+        # Imported here so importing this module does not load the validator models
+        from guardrails.hub import ToxicLanguage
+        from guardrails import Guard
+
         self.guard = Guard().use_many(
             ToxicLanguage(on_fail="exception")
         )
@@ -23,21 +41,7 @@ class CustomGuardrailHook(HookProvider):
 
     def extract_text_from_message(self, message: Dict[str, Any]) -> str:
         """Extract text content from a Bedrock Message object."""
-        content_blocks = message.get('content', [])
-        text_parts = []
-        
-        for block in content_blocks:
-            if 'text' in block:
-                text_parts.append(block['text'])
-            elif 'toolResult' in block:
-                # Extract text from tool results
-                tool_result = block['toolResult']
-                if 'content' in tool_result:
-                    for content in tool_result['content']:
-                        if 'text' in content:
-                            text_parts.append(content['text'])
-        
-        return ' '.join(text_parts)
+        return ' '.join(iter_message_text(message.get('content', [])))
 
     def guardrail_check(self, event):
         # Get the latest message from the event
@@ -47,7 +51,9 @@ class CustomGuardrailHook(HookProvider):
             # Extract text content from the Bedrock Message format
             message_text = self.extract_text_from_message(latest_message)
             
-            if message_text.strip():
+            if TRIVIAL_MESSAGE_PATTERN.match(message_text.strip()):
+                print(f"✓ User message is trivial, skipping guardrail checks")
+            elif message_text.strip():
                 try:
                     # Run Guardrails AI validation on the extracted text
                     result = self.guard.validate(message_text)
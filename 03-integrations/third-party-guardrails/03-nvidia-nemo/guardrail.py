@@ -4,6 +4,15 @@ Integrates with to NVIDIA NeMO server running locally.
 from strands.hooks import HookProvider, HookRegistry, MessageAddedEvent
 from typing import Dict
 import httpx
+import orjson
+
+# Shared client so the keep-alive connection to the NeMo server is reused across messages
+NEMO_CLIENT = httpx.Client(
+    base_url="http://127.0.0.1:8000",
+    headers={"Content-Type": "application/json"},
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
 
 class CustomGuardrailHook(HookProvider):
     def register_hooks(self, registry: HookRegistry) -> None:
@@ -31,18 +40,12 @@ class CustomGuardrailHook(HookProvider):
                     "content": message_text
                 }]
             }
-
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            url = "http://127.0.0.1:8000/v1/chat/completions"
             
             try:
-                response = httpx.post(url, headers=headers, json=payload, timeout=10.0)
+                response = NEMO_CLIENT.post("/v1/chat/completions", content=orjson.dumps(payload))
                 response.raise_for_status()
                 
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 messages = response_data.get("messages")
                 
                 if not messages or not isinstance(messages, list) or len(messages) == 0:
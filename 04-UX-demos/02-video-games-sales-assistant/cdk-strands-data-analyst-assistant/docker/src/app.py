@@ -7,14 +7,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 import boto3
-import json
+import orjson
 from uuid import uuid4
 import os
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 # Import my tools
 from tools import run_sql_query, get_tables_information
 from utils import load_file_content, save_raw_query_result, read_messages_by_session, save_messages, load_config
-from utils import validate_cognito_token_with_config, extract_bearer_token
+from utils import validate_cognito_token_with_config, extract_bearer_token, prefetch_jwks
+from utils.aws_clients import MAX_POOL_CONNECTIONS
+
+# Request-path diagnostics go through a leveled logger; set LOG_LEVEL=DEBUG for the full banners
+logging.basicConfig(format="%(message)s")
+logger = logging.getLogger("app")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
 
 # Load configuration from SSM Parameter Store
 # Get PROJECT_ID from environment variable to construct SSM parameter paths
@@ -37,8 +48,47 @@ except Exception as e:
     # Set empty config as fallback
     config = {}
 
+# Configuration read on every request, resolved once
+LAST_NUMBER_OF_MESSAGES = config.get('LAST_NUMBER_OF_MESSAGES', 20)
+COGNITO_USER_POOL_ID = os.environ.get('COGNITO_USER_POOL_ID', 'N/A')
+COGNITO_ENABLED = COGNITO_USER_POOL_ID != "N/A"
+
+# Streamed text is buffered and sent once it reaches this many characters
+# or once this many seconds have passed since the last send
+STREAM_FLUSH_CHARS = 128
+STREAM_FLUSH_INTERVAL_SECONDS = 0.03
+
+# Rows of a query result returned to the model; the full result is saved to DynamoDB
+TOOL_RESULT_PREVIEW_ROWS = int(os.environ.get('TOOL_RESULT_PREVIEW_ROWS', '50'))
+
+# Text streamed to the client when the assistant calls each tool
+TOOL_USE_STREAM_TEXT = {
+    'execute_sql_query': lambda tool_use: f" {tool_use['input']['description']}.\n\n" if "input" in tool_use else None,
+    'get_tables_information': lambda tool_use: "\n\n",
+    'current_time': lambda tool_use: "\n\n",
+}
+
+# Query result writes run on this pool while the agent keeps working; each
+# request waits for its own writes before the response completes
+dynamodb_write_executor = ThreadPoolExecutor(max_workers=MAX_POOL_CONNECTIONS, thread_name_prefix="dynamodb-write")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the Cognito signing key cache before the first request is served.
+    A failure here is not fatal: keys are fetched on demand as before.
+    On shutdown, wait for any DynamoDB writes still in flight.
+    """
+    try:
+        if await asyncio.to_thread(prefetch_jwks):
+            print(f"\n🔑 COGNITO SIGNING KEYS PREFETCHED")
+    except Exception as e:
+        print(f"\n⚠️  Could not prefetch Cognito signing keys: {e}")
+    yield
+    await asyncio.to_thread(dynamodb_write_executor.shutdown, wait=True)
+
 # Initialize the FastAPI application
-app = FastAPI(title="Data Analyst Assistant API")
+app = FastAPI(title="Data Analyst Assistant API", lifespan=lifespan)
 
 # CORS middleware to allow web application origin
 web_app_url = os.environ.get('WEB_APPLICATION_URL', 'http://localhost:3000')
@@ -85,6 +135,8 @@ def load_system_prompt():
 
 # Load the system prompt
 DATA_ANALYST_SYSTEM_PROMPT = load_system_prompt()
+# Split once around the timezone placeholder so each request only concatenates
+_PROMPT_PREFIX, _PROMPT_PLACEHOLDER, _PROMPT_SUFFIX = DATA_ANALYST_SYSTEM_PROMPT.partition("{timezone}")
 
 @app.get('/health')
 def health_check():
@@ -113,6 +165,8 @@ async def run_data_analyst_assistant_with_stream_response(bedrock_model, system_
     """
     user_prompt = prompt
     user_prompt_uuid = prompt_uuid
+    # Query result writes started by the SQL tool during this request
+    pending_query_result_saves = []
 
     @tool
     def execute_sql_query(sql_query: str, description: str) -> str:
@@ -124,68 +178,71 @@ async def run_data_analyst_assistant_with_stream_response(bedrock_model, system_
             description: Concise explanation of the SQL query
 
         Returns:
-            str: JSON string containing the query results or error message
+            str: JSON string containing up to TOOL_RESULT_PREVIEW_ROWS result rows,
+                 the total row count and a reference to the full saved result,
+                 or an error message
         """
         nonlocal user_prompt
         nonlocal user_prompt_uuid
         try:
             # Execute the SQL query using the existing function
             # But we need to parse the response first
-            response_json = json.loads(run_sql_query(sql_query))
+            raw_response = run_sql_query(sql_query)
+            response_json = orjson.loads(raw_response)
             
-            # Check if there was an error
+            # Errors are passed through as already serialized
             if "error" in response_json:
-                return json.dumps(response_json)
+                return raw_response.decode()
             
             # Extract the results
             records_to_return = response_json.get("result", [])
             message = response_json.get("message", "")
             
-            # Prepare result object
-            if message != "":
-                result = {
-                    "result": records_to_return,
-                    "message": message
-                }
-            else:
-                result = {
-                    "result": records_to_return
-                }
+            # run_sql_query already returns the {"result", "message"} object that is saved
+            result = response_json
             
-            # Save to DynamoDB using the new function
-            save_result = save_raw_query_result(
+            # Save to DynamoDB while the agent continues; save_raw_query_result logs any failure
+            pending_query_result_saves.append(dynamodb_write_executor.submit(
+                save_raw_query_result,
                 user_prompt_uuid,
                 user_prompt,
                 sql_query,
                 description,
                 result,
                 message
-            )
+            ))
             
-            if not save_result["success"]:
-                result["saved"] = False
-                result["save_error"] = save_result["error"]
+            # Only a preview goes back to the model to keep the tool response short
+            model_result = {
+                "result": records_to_return[:TOOL_RESULT_PREVIEW_ROWS],
+                "total_rows": len(records_to_return),
+                "truncated": len(records_to_return) > TOOL_RESULT_PREVIEW_ROWS,
+                "ref": user_prompt_uuid
+            }
+            if message != "":
+                model_result["message"] = message
                 
-            return json.dumps(result)
+            return orjson.dumps(model_result).decode()
                 
         except Exception as e:
-            return json.dumps({"error": f"Unexpected error: {str(e)}"})
+            return orjson.dumps({"error": f"Unexpected error: {str(e)}"}).decode()
 
     # Get conversation history
-    message_history = read_messages_by_session(
+    # The DynamoDB query blocks, so it runs in a worker thread to keep the event loop free
+    message_history = await asyncio.to_thread(
+        read_messages_by_session,
         session_id, 
-        config.get('LAST_NUMBER_OF_MESSAGES', 20)
+        LAST_NUMBER_OF_MESSAGES
     )
     if len(message_history) > 0:
         starting_message_id = len(message_history)
     else:
         starting_message_id = 0
-    print(f"\n📚 CONVERSATION HISTORY")
-    print("-" * 40)
-    print(f"📊 Messages loaded: {len(message_history)}")
-    print(f"🔗 Session ID: {session_id}")
-    print(f"🆔 Starting message ID: {starting_message_id}")
-    print("-" * 40)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "\n📚 CONVERSATION HISTORY\n%s\n📊 Messages loaded: %s\n🔗 Session ID: %s\n🆔 Starting message ID: %s\n%s",
+            "-" * 40, len(message_history), session_id, starting_message_id, "-" * 40
+        )
 
     # Initialize the data analyst agent
     data_analyst_agent = Agent(
@@ -199,26 +256,58 @@ async def run_data_analyst_assistant_with_stream_response(bedrock_model, system_
     # Stream the response to the client
     stream = data_analyst_agent.stream_async(prompt)
 
+    # Text chunks are batched so each network write carries several tokens
+    buffer = []
+    buffered_chars = 0
+    last_flush = time.monotonic()
+
     async for event in stream:            
-        if "message" in event and "content" in event["message"] and "role" in event["message"] and event["message"]["role"] == "assistant":
-            for content_item in event['message']['content']:
-                if "toolUse" in content_item and "input" in content_item["toolUse"] and content_item["toolUse"]['name'] == 'execute_sql_query':
-                    yield f" {content_item['toolUse']['input']['description']}.\n\n"
-                elif "toolUse" in content_item and "name" in content_item["toolUse"] and content_item["toolUse"]['name'] == 'get_tables_information':
-                    yield "\n\n"
-                elif "toolUse" in content_item and "name" in content_item["toolUse"] and content_item["toolUse"]['name'] == 'current_time':
-                    yield "\n\n"
-        elif "data" in event:
-            yield event['data']
-
-
-    # Save the conversation
-    save_messages(
+        message = event.get("message")
+        if message is not None and message.get("role") == "assistant" and "content" in message:
+            # Tool use descriptions are shown right away, after any buffered text
+            if buffer:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                last_flush = time.monotonic()
+            for content_item in message['content']:
+                tool_use = content_item.get("toolUse")
+                if tool_use is None:
+                    continue
+                stream_text = TOOL_USE_STREAM_TEXT.get(tool_use.get("name"))
+                if stream_text is not None:
+                    text = stream_text(tool_use)
+                    if text is not None:
+                        yield text
+            continue
+
+        data = event.get("data")
+        if data is not None:
+            buffer.append(data)
+            buffered_chars += len(data)
+            now = time.monotonic()
+            if buffered_chars >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                last_flush = now
+
+    if buffer:
+        yield "".join(buffer)
+
+    # The response only completes once this generator returns, so saving here
+    # keeps DynamoDB latency off the visible output while still guaranteeing
+    # the next turn reads this one from history and the client can fetch query
+    # results as soon as the stream ends
+    await asyncio.to_thread(
+        save_messages,
         session_id, 
         user_prompt_uuid, 
         starting_message_id, 
         data_analyst_agent.messages
     )
+    if pending_query_result_saves:
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in pending_query_result_saves))
 
 class PromptRequest(BaseModel):
     """
@@ -259,16 +348,10 @@ async def assistant_streaming(
         HTTPException: If the request is invalid, authentication fails, or if an error occurs
     """
     try:
-        # Check if Cognito is configured before attempting authentication
-        cognito_user_pool_id = os.environ.get('COGNITO_USER_POOL_ID', 'N/A')
-        
         # Skip authentication if Cognito is not configured (N/A values)
-        if ( cognito_user_pool_id == "N/A"):
+        if not COGNITO_ENABLED:
             
-            print(f"\n⚠️  COGNITO NOT CONFIGURED - SKIPPING AUTHENTICATION")
-            print("-" * 50)
-            print(f"🔧 COGNITO_USER_POOL_ID: {cognito_user_pool_id}")
-            print("-" * 50)
+            logger.debug("⚠️  COGNITO NOT CONFIGURED - SKIPPING AUTHENTICATION (COGNITO_USER_POOL_ID: %s)", COGNITO_USER_POOL_ID)
         else:
             # Cognito is configured, validate the token
             try:
@@ -277,29 +360,23 @@ async def assistant_streaming(
                 if not token:
                     raise HTTPException(status_code=401, detail="Missing or invalid Authorization header")
                 
-                # Validate the token using SSM configuration
-                decoded_token = validate_cognito_token_with_config(token)
+                # Validate the token using SSM configuration, off the event loop since a JWKS fetch may block
+                decoded_token = await asyncio.to_thread(validate_cognito_token_with_config, token)
                 if not decoded_token:
                     raise HTTPException(status_code=401, detail="Invalid or expired token")
                 
-                print(f"\n🔐 AUTHENTICATED USER")
-                print("-" * 40)
-                print(f"👤 Username: {decoded_token.get('username', 'unknown')}")
-                print(f"📧 Email: {decoded_token.get('email', 'unknown')}")
-                print(f"🔑 Token Use: {decoded_token.get('token_use', 'unknown')}")
-                print("-" * 40)
+                logger.info(
+                    "🔐 AUTHENTICATED USER: %s (token use: %s)",
+                    decoded_token.get('username', 'unknown'), decoded_token.get('token_use', 'unknown')
+                )
+                logger.debug("📧 Email: %s", decoded_token.get('email', 'unknown'))
                 
             except Exception as cognito_error:
-                print(f"\n❌ AUTHENTICATION FAILED")
-                print("-" * 40)
-                print(f"🚨 Error: {cognito_error}")
-                print("-" * 40)
+                logger.warning("❌ AUTHENTICATION FAILED: %s", cognito_error)
                 raise HTTPException(status_code=401, detail=str(cognito_error))
-        print(f"\n🚀 NEW REQUEST RECEIVED")
-        print("=" * 50)
-        print(f"📝 Prompt: {request.prompt[:100]}{'...' if len(request.prompt) > 100 else ''}")
-        print(f"🤖 Model: {request.bedrock_model_id}")
-        print("=" * 50)
+        logger.info("🚀 NEW REQUEST RECEIVED (model: %s)", request.bedrock_model_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📝 Prompt: %s%s", request.prompt[:100], '...' if len(request.prompt) > 100 else '')
     
         prompt = request.prompt
         if not prompt:
@@ -319,20 +396,21 @@ async def assistant_streaming(
 
         bedrock_model_id = request.bedrock_model_id or 'us.anthropic.claude-3-7-sonnet-20250219-v1:0'
         
-        print(f"\n🔧 REQUEST PROCESSING")
-        print("-" * 40)
-        print(f"🆔 Prompt UUID: {prompt_uuid}")
-        print(f"🌍 Timezone: {user_timezone}")
-        print(f"🔗 Session ID: {session_id}")
-        print(f"🤖 Model ID: {bedrock_model_id}")
-        print("-" * 40)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n🔧 REQUEST PROCESSING\n%s\n🆔 Prompt UUID: %s\n🌍 Timezone: %s\n🔗 Session ID: %s\n🤖 Model ID: %s\n%s",
+                "-" * 40, prompt_uuid, user_timezone, session_id, bedrock_model_id, "-" * 40
+            )
 
         # Create a Bedrock model with the custom session
         bedrock_model = BedrockModel(
             model_id=bedrock_model_id
         )
 
-        system_prompt = DATA_ANALYST_SYSTEM_PROMPT.replace("{timezone}", user_timezone)
+        if _PROMPT_PLACEHOLDER:
+            system_prompt = f"{_PROMPT_PREFIX}{user_timezone}{_PROMPT_SUFFIX}"
+        else:
+            system_prompt = DATA_ANALYST_SYSTEM_PROMPT
 
         return StreamingResponse(
             run_data_analyst_assistant_with_stream_response(bedrock_model, system_prompt, prompt, prompt_uuid, session_id),
@@ -345,18 +423,25 @@ def main():
     """Entry point for the Data Analyst Assistant application."""
     port = int(os.environ.get('PORT', '8000'))
     project_id = os.environ.get('PROJECT_ID', 'strands-data-analyst-assistant')
+    # Each worker is a separate process with its own config, JWKS and client caches
+    workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 2))
     
     print(f"\n🚀 STARTING DATA ANALYST ASSISTANT")
     print("=" * 50)
     print(f"🌐 Host: 0.0.0.0")
     print(f"🔌 Port: {port}")
+    print(f"👷 Workers: {workers}")
     print(f"🔧 Project ID: {project_id}")
     print("=" * 50)
     
+    # Multiple workers need the application as an import string
     uvicorn.run(
-        app, 
+        "app:app", 
         host='0.0.0.0', 
         port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
         timeout_keep_alive=300,
         timeout_graceful_shutdown=30,
         limit_max_requests=1000,
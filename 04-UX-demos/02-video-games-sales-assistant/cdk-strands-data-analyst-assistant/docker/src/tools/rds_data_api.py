@@ -15,14 +15,14 @@ Optional parameters:
 - MAX_RESPONSE_SIZE_BYTES: Maximum size of the response in bytes (default: 25600)
 """
 
-import boto3
-import json
+import orjson
 from botocore.exceptions import ClientError
 from decimal import Decimal
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.ssm_utils import load_config
+from utils.aws_clients import get_client
 
 # Load configuration from SSM parameters
 try:
@@ -56,12 +56,12 @@ def validate_configuration():
 
 def get_rds_data_client():
     """
-    Creates and returns an RDS Data API client using default AWS configuration.
+    Returns the shared RDS Data API client using default AWS configuration.
 
     Returns:
         boto3.client: RDS Data API client
     """
-    return boto3.client("rds-data")
+    return get_client("rds-data")
 
 
 def execute_statement(
@@ -106,22 +106,9 @@ def execute_statement(
         return {"error": str(e)}
 
 
-def get_size(string: str) -> int:
+def run_sql_query(sql_query: str) -> bytes:
     """
-    Calculates the size of a string in bytes when encoded as UTF-8.
-
-    Args:
-        string: The string to measure
-
-    Returns:
-        int: Size of the string in bytes
-    """
-    return len(string.encode("utf-8"))
-
-
-def run_sql_query(sql_query: str) -> str:
-    """
-    Executes a SQL query using the RDS Data API and returns the results as JSON.
+    Executes a SQL query using the RDS Data API and returns the results as UTF-8 JSON bytes.
 
     The function handles connection to the database, query execution, and formatting
     of results. Special data types (Decimal, date) are properly converted for JSON.
@@ -131,7 +118,7 @@ def run_sql_query(sql_query: str) -> str:
         sql_query: SQL query string to execute
 
     Returns:
-        str: JSON string containing query results or error information
+        bytes: JSON document containing query results or error information
     """
     print("\n" + "=" * 70)
     print("🔍 SQL QUERY EXECUTION")
@@ -150,7 +137,7 @@ def run_sql_query(sql_query: str) -> str:
         )
 
         if "error" in response:
-            return json.dumps(
+            return orjson.dumps(
                 {
                     "error": f"Something went wrong executing the query: {response['error']}"
                 }
@@ -191,9 +178,9 @@ def run_sql_query(sql_query: str) -> str:
                 records.append(record)
 
             max_response_size = CONFIG.get("MAX_RESPONSE_SIZE_BYTES", 25600)
-            if get_size(json.dumps(records)) > max_response_size:
+            if len(orjson.dumps(records)) > max_response_size:
                 for item in records:
-                    if get_size(json.dumps(records_to_return)) <= max_response_size:
+                    if len(orjson.dumps(records_to_return)) <= max_response_size:
                         records_to_return.append(item)
                 message = (
                     f"The data is too large, it has been truncated from "
@@ -203,9 +190,9 @@ def run_sql_query(sql_query: str) -> str:
                 records_to_return = records
 
         if message != "":
-            return json.dumps({"result": records_to_return, "message": message})
+            return orjson.dumps({"result": records_to_return, "message": message})
         else:
-            return json.dumps({"result": records_to_return})
+            return orjson.dumps({"result": records_to_return})
 
     except ValueError as e:
         import traceback
@@ -222,7 +209,7 @@ def run_sql_query(sql_query: str) -> str:
         print(traceback.format_exc())
         print("=" * 70 + "\n")
         
-        return json.dumps({"error": str(e)})
+        return orjson.dumps({"error": str(e)})
     except Exception as e:
         import traceback
         
@@ -239,4 +226,4 @@ def run_sql_query(sql_query: str) -> str:
         print(traceback.format_exc())
         print("=" * 70 + "\n")
         
-        return json.dumps({"error": f"Unexpected error: {str(e)}"})
\ No newline at end of file
+        return orjson.dumps({"error": f"Unexpected error: {str(e)}"})
\ No newline at end of file
@@ -2,7 +2,7 @@
 from .ssm_utils import load_config, get_ssm_parameter, get_ssm_client
 from .dynamodb_utils import save_raw_query_result, read_messages_by_session, save_messages
 from .file_utils import load_file_content
-from .cognito_utils import validate_cognito_token_with_config, extract_bearer_token
+from .cognito_utils import validate_cognito_token_with_config, extract_bearer_token, prefetch_jwks
 
 __all__ = [
     'load_config',
@@ -13,5 +13,6 @@ __all__ = [
     'save_messages',
     'load_file_content',
     'validate_cognito_token_with_config',
-    'extract_bearer_token'
+    'extract_bearer_token',
+    'prefetch_jwks'
 ]
\ No newline at end of file
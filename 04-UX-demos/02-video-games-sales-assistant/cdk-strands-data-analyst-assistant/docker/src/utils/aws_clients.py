@@ -0,0 +1,82 @@
+"""
+AWS Client Utilities
+
+This module keeps a single boto3 session for the process and hands out the
+clients and DynamoDB tables built from it. Reusing them across requests keeps
+connection pools warm instead of resolving endpoints and credentials and
+opening new connections on every call.
+"""
+
+import threading
+import boto3
+from botocore.config import Config
+
+# Connection pool, keep-alive and retry settings shared by every client
+MAX_POOL_CONNECTIONS = 64
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# boto3 sessions are not thread safe, so clients are created under a lock
+_lock = threading.Lock()
+_session = None
+_clients = {}
+_dynamodb_resource = None
+_dynamodb_tables = {}
+
+
+def get_boto3_session():
+    """
+    Returns the boto3 session shared by this process, creating it on first use.
+
+    Returns:
+        boto3.session.Session: Shared session
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = boto3.session.Session()
+        return _session
+
+
+def get_client(service_name):
+    """
+    Returns the shared client for an AWS service, creating it on first use.
+
+    Args:
+        service_name: Name of the AWS service, e.g. 'dynamodb'
+
+    Returns:
+        boto3.client: Shared client for the service
+    """
+    session = get_boto3_session()
+    with _lock:
+        client = _clients.get(service_name)
+        if client is None:
+            client = session.client(service_name, config=AWS_CLIENT_CONFIG)
+            _clients[service_name] = client
+        return client
+
+
+def get_dynamodb_table(table_name):
+    """
+    Returns the shared DynamoDB Table resource for a table name.
+
+    Args:
+        table_name: Name of the DynamoDB table
+
+    Returns:
+        boto3.resources.factory.dynamodb.Table: Shared table resource
+    """
+    global _dynamodb_resource
+    session = get_boto3_session()
+    with _lock:
+        table = _dynamodb_tables.get(table_name)
+        if table is None:
+            if _dynamodb_resource is None:
+                _dynamodb_resource = session.resource("dynamodb", config=AWS_CLIENT_CONFIG)
+            table = _dynamodb_resource.Table(table_name)
+            _dynamodb_tables[table_name] = table
+        return table
\ No newline at end of file
@@ -1,48 +1,51 @@
 import jwt
 from jwt import PyJWKClient
-import requests
 import os
-import boto3
+import threading
 from typing import Dict, Optional
-from functools import lru_cache
-import json
-from .ssm_utils import load_config
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-import base64
-
-# Load configuration from SSM
-try:
-    config = load_config()
-except Exception as e:
-    print(f"❌ Error loading config in cognito_utils: {e}")
-    config = {}
-
-
-@lru_cache(maxsize=10)
-def get_jwks(user_pool_id: str) -> Dict:
+from .aws_clients import get_boto3_session
+
+# PyJWKClient per user pool, kept for the life of the process so the parsed signing keys stay cached
+_jwks_clients: Dict[str, PyJWKClient] = {}
+_jwks_clients_lock = threading.Lock()
+
+
+def get_jwks_client(user_pool_id: str) -> PyJWKClient:
     """
-    Fetch and cache the JSON Web Key Set (JWKS) from Cognito.
+    Return the shared JWKS client for a Cognito user pool, creating it on first use.
     
     Args:
         user_pool_id (str): Cognito User Pool ID
     
     Returns:
-        Dict: The JWKS containing public keys for token verification
+        PyJWKClient: Client that caches the pool's signing keys for an hour
     """
-
-    session = boto3.session.Session()
-    region = session.region_name
+    with _jwks_clients_lock:
+        jwks_client = _jwks_clients.get(user_pool_id)
+        if jwks_client is None:
+            region = get_boto3_session().region_name
+            
+            jwks_url = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json"
+            jwks_client = PyJWKClient(jwks_url, cache_keys=True, lifespan=3600)
+            _jwks_clients[user_pool_id] = jwks_client
+        return jwks_client
+
+
+def prefetch_jwks() -> bool:
+    """
+    Fetch the configured user pool's signing keys into the shared JWKS client cache.
     
-    jwks_url = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json"
+    Called at startup so the first authenticated request does not wait on Cognito.
     
-    try:
-        response = requests.get(jwks_url, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        print(f"❌ Error fetching JWKS: {str(e)}")
-        raise Exception(f"Failed to fetch JWKS: {str(e)}")
+    Returns:
+        bool: True if keys were fetched, False if Cognito is not configured
+    """
+    user_pool_id = os.environ.get('COGNITO_USER_POOL_ID', 'N/A')
+    if not user_pool_id or user_pool_id == "N/A":
+        return False
+    
+    get_jwks_client(user_pool_id).get_signing_keys()
+    return True
 
 
 def get_public_key(token_header: Dict, user_pool_id: str):
@@ -56,48 +59,7 @@ def get_public_key(token_header: Dict, user_pool_id: str):
     Returns:
         The public key for verification
     """
-
-    session = boto3.session.Session()
-    region = session.region_name
-    
-    jwks_url = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json"
-    
-    try:
-        # Use PyJWKClient for better compatibility
-        jwks_client = PyJWKClient(jwks_url)
-        signing_key = jwks_client.get_signing_key_from_jwt(token_header.get('kid'))
-        return signing_key.key
-    except Exception as e:
-        # Fallback to manual JWKS parsing
-        jwks = get_jwks(user_pool_id)
-        
-        # Find the key that matches the token's key ID
-        for key in jwks.get('keys', []):
-            if key.get('kid') == token_header.get('kid'):
-                try:
-                    # Try different methods based on PyJWT version
-                    if hasattr(jwt.algorithms, 'RSAAlgorithm'):
-                        return jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(key))
-                    else:
-                        
-                        # Extract RSA components
-                        n = base64.urlsafe_b64decode(key['n'] + '==')
-                        e = base64.urlsafe_b64decode(key['e'] + '==')
-                        
-                        # Convert to integers
-                        n_int = int.from_bytes(n, 'big')
-                        e_int = int.from_bytes(e, 'big')
-                        
-                        # Create RSA public key
-                        public_numbers = rsa.RSAPublicNumbers(e_int, n_int)
-                        public_key = public_numbers.public_key()
-                        
-                        return public_key
-                except Exception as key_error:
-                    print(f"❌ Error converting JWK to key: {key_error}")
-                    continue
-        
-        raise Exception("Public key not found in JWKS")
+    return get_jwks_client(user_pool_id).get_signing_key(token_header.get('kid')).key
 
 
 def validate_cognito_token(token: str, user_pool_id: str) -> Optional[Dict]:
@@ -112,15 +74,10 @@ def validate_cognito_token(token: str, user_pool_id: str) -> Optional[Dict]:
         Optional[Dict]: The decoded token payload if valid, None if invalid
     """
     try:
-        session = boto3.session.Session()
-        region = session.region_name
-        
-        # Use PyJWKClient for simpler token validation
-        jwks_url = f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json"
-        jwks_client = PyJWKClient(jwks_url)
+        region = get_boto3_session().region_name
         
-        # Get the signing key from the token
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
+        # Get the signing key from the token, using the cached JWKS client for this pool
+        signing_key = get_jwks_client(user_pool_id).get_signing_key_from_jwt(token)
         
         # Verify and decode the token
         decoded_token = jwt.decode(
@@ -183,13 +140,9 @@ def extract_bearer_token(authorization_header: str) -> Optional[str]:
     Returns:
         Optional[str]: The extracted token, or None if not found
     """
-    if not authorization_header:
-        return None
-    
-    # Check if it starts with "Bearer "
-    if authorization_header.startswith("Bearer "):
-        return authorization_header[7:]  # Remove "Bearer " prefix
-    
+    # Return whatever follows the "Bearer " prefix
+    if authorization_header and authorization_header[:7] == "Bearer ":
+        return authorization_header[7:]
     return None
 
 
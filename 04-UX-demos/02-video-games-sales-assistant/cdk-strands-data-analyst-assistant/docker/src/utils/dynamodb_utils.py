@@ -1,10 +1,12 @@
-import boto3
-import json
+import orjson
+import time
+from concurrent.futures import ThreadPoolExecutor
 from boto3.dynamodb.conditions import Key
 from typing import List, Dict, Any
 from datetime import datetime
 import os
 from .ssm_utils import load_config
+from .aws_clients import get_client, get_dynamodb_table
 
 # Load configuration from SSM
 try:
@@ -13,6 +15,20 @@ except Exception as e:
     print(f"❌ Error loading config in dynamodb_utils: {e}")
     config = {}
 
+# Table names used on every read and write, resolved once
+RAW_QUERY_RESULTS_TABLE_NAME = config.get("RAW_QUERY_RESULTS_TABLE_NAME")
+CONVERSATION_TABLE_NAME = config.get("CONVERSATION_TABLE_NAME")
+
+# BatchWriteItem accepts at most 25 put requests per call; larger saves are
+# split into chunks and written in parallel
+BATCH_WRITE_SIZE = 25
+BATCH_WRITE_MAX_WORKERS = 8
+BATCH_WRITE_MAX_RETRIES = 5
+batch_write_executor = ThreadPoolExecutor(
+    max_workers=BATCH_WRITE_MAX_WORKERS,
+    thread_name_prefix="dynamodb-batch-write",
+)
+
 def save_raw_query_result(user_message_uuid, user_message, sql_query, sql_query_description, result, message):
     """
     Store SQL query execution results and metadata in DynamoDB.
@@ -33,12 +49,12 @@ def save_raw_query_result(user_message_uuid, user_message, sql_query, sql_query_
     """
     try:
         # Use provided parameters or fall back to SSM config
-        raw_query_results_table = config.get("RAW_QUERY_RESULTS_TABLE_NAME")
+        raw_query_results_table = RAW_QUERY_RESULTS_TABLE_NAME
         
         if not raw_query_results_table:
             return {"success": False, "error": "RAW_QUERY_RESULTS_TABLE_NAME not configured"}
         
-        dynamodb_client = boto3.client('dynamodb')
+        dynamodb_client = get_client('dynamodb')
         
         response = dynamodb_client.put_item(
             TableName=raw_query_results_table,
@@ -49,7 +65,7 @@ def save_raw_query_result(user_message_uuid, user_message, sql_query, sql_query_
                 "user_message": {"S": user_message},
                 "sql_query": {"S": sql_query},
                 "sql_query_description": {"S": sql_query_description},
-                "data": {"S": json.dumps(result)},
+                "data": {"S": orjson.dumps(result).decode()},
                 "message_result": {"S": message}
             }
         )
@@ -85,7 +101,7 @@ def read_messages_by_session(session_id: str, last_number_of_messages: int = 20)
         List[Dict]: Parsed message objects in chronological order, empty if table not configured
     """
     # Use provided parameters or fall back to SSM config
-    conversation_table = config.get("CONVERSATION_TABLE_NAME")
+    conversation_table = CONVERSATION_TABLE_NAME
     
     if not conversation_table:
         print(f"\n⚠️ CONFIGURATION WARNING")
@@ -96,23 +112,32 @@ def read_messages_by_session(session_id: str, last_number_of_messages: int = 20)
         return []
     
     try:
-        dynamodb_resource = boto3.resource('dynamodb')
-        table = dynamodb_resource.Table(conversation_table)
-        
-        response = table.query(
-            KeyConditionExpression=Key('session_id').eq(session_id),
-            ProjectionExpression='message',
-            Limit=last_number_of_messages,
-            ScanIndexForward=False  # Sort by message_id DESC (most recent first)
-        )
+        table = get_dynamodb_table(conversation_table)
+        
+        query_kwargs = {
+            'KeyConditionExpression': Key('session_id').eq(session_id),
+            'ProjectionExpression': 'message',
+            'ScanIndexForward': False,  # Sort by message_id DESC (most recent first)
+            'ConsistentRead': False  # Eventually consistent reads are enough for history
+        }
+        
+        # A page can stop short of Limit at the 1 MB response cap, so keep
+        # reading until enough items are collected or the session is exhausted
+        items = []
+        while len(items) < last_number_of_messages:
+            response = table.query(Limit=last_number_of_messages - len(items), **query_kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
         
         messages = []
-        for item in response.get('Items', []):
+        for item in items:
             message_data = item.get('message')
             if message_data:
                 try:
-                    messages.append(json.loads(message_data))
-                except json.JSONDecodeError as e:
+                    messages.append(orjson.loads(message_data))
+                except orjson.JSONDecodeError as e:
                     print(f"\n🔧 JSON PARSE ERROR")
                     print("-"*40)
                     print(f"🚨 Error: {e}")
@@ -145,44 +170,84 @@ def messages_objects_to_strings(obj_array):
     - Table information tool results
     
     Args:
-        obj_array (List): Array of message objects from conversation history
+        obj_array (List): Array of message objects from conversation history; items that
+            are already JSON strings are kept as-is
         
     Returns:
         List[str]: Filtered message objects as JSON strings for storage
     """
     filtered_objs = []
     
-    for i, obj in enumerate(obj_array):
-        # Simple text messages from user or assistant
-        if obj["role"] in ["user", "assistant"] and "content" in obj:
-            # Check if content contains only text items (no toolUse or toolResult)
-            has_only_text = True
-            for item in obj["content"]:
-                if "text" not in item:
-                    has_only_text = False
-                    break            
-            if has_only_text:
-                filtered_objs.append(obj)
+    for obj in obj_array:
+        # Already serialized messages are stored without another encode
+        if isinstance(obj, str):
+            filtered_objs.append(obj)
+            continue
+
+        role = obj["role"]
+        if role not in ("user", "assistant") or "content" not in obj:
+            continue
+        content = obj["content"]
+
+        # Simple text messages from user or assistant (no toolUse or toolResult)
+        if all("text" in item for item in content):
+            filtered_objs.append(obj)
+            continue
         
         # Messages where assistant is using a tool
-        if obj["role"] == "assistant" and "content" in obj:
-            for item in obj["content"]:
-                if "toolUse" in item and "name" in item['toolUse'] and item['toolUse']['name']=="execute_sql_query":
-                    #data = { 'toolUsed': 'execute_sql_query', 'input': item['toolUse']['input'] }
-                    data = f"{item['toolUse']['input']['description']}: {item['toolUse']['input']['sql_query']}"
-                    filtered_objs.append({ 'role': 'assistant', 'content': [{ 'text' : data }] })
-                    break
-
-        if obj["role"] == "user" and "content" in obj:
-            for item in obj["content"]:
-                if "toolResult" in item and "content" in item['toolResult'] and len(item['toolResult']['content'])>0:
-                    for content_item in item['toolResult']['content']:
-                        if "text" in content_item:
-                            if "'toolUsed': 'get_tables_information'" in content_item["text"]:
-                                filtered_objs.append({ 'role': 'user', 'content': [{ 'text' : content_item["text"]}] })
-                                break
-
-    return [json.dumps(obj) for obj in filtered_objs]
+        if role == "assistant":
+            tool_use = next(
+                (item["toolUse"] for item in content
+                 if "toolUse" in item and item["toolUse"].get("name") == "execute_sql_query"),
+                None
+            )
+            if tool_use is not None:
+                data = f"{tool_use['input']['description']}: {tool_use['input']['sql_query']}"
+                filtered_objs.append({ 'role': 'assistant', 'content': [{ 'text' : data }] })
+            continue
+
+        # Table information tool results returned to the assistant
+        for item in content:
+            if "toolResult" not in item:
+                continue
+            text = next(
+                (content_item["text"] for content_item in item["toolResult"].get("content", [])
+                 if "'toolUsed': 'get_tables_information'" in content_item.get("text", "")),
+                None
+            )
+            if text is not None:
+                filtered_objs.append({ 'role': 'user', 'content': [{ 'text' : text }] })
+
+    return [obj if isinstance(obj, str) else orjson.dumps(obj).decode() for obj in filtered_objs]
+
+
+def batch_write_chunk(table_name: str, put_requests: List[Dict[str, Any]]) -> None:
+    """
+    Write up to 25 put requests with BatchWriteItem, retrying unprocessed items.
+
+    Unprocessed items returned by DynamoDB (for example when throttled) are
+    re-submitted with exponential backoff.
+
+    Args:
+        table_name (str): Target DynamoDB table name
+        put_requests (List[Dict]): PutRequest entries in low-level attribute format
+
+    Raises:
+        RuntimeError: If items remain unprocessed after all retries
+    """
+    dynamodb_client = get_client('dynamodb')
+    request_items = {table_name: put_requests}
+
+    for attempt in range(BATCH_WRITE_MAX_RETRIES + 1):
+        response = dynamodb_client.batch_write_item(RequestItems=request_items)
+        request_items = response.get('UnprocessedItems') or {}
+        if not request_items:
+            return
+        if attempt < BATCH_WRITE_MAX_RETRIES:
+            time.sleep(0.05 * (2 ** attempt))
+
+    unprocessed = len(request_items.get(table_name, []))
+    raise RuntimeError(f"{unprocessed} items unprocessed after {BATCH_WRITE_MAX_RETRIES} retries")
 
 
 def save_messages(session_id: str, message_uuid: str, starting_message_id: int, messages: List[str]) -> bool:
@@ -190,7 +255,8 @@ def save_messages(session_id: str, message_uuid: str, starting_message_id: int,
     Batch write filtered conversation messages to DynamoDB starting from specific ID.
     
     Filters messages through messages_objects_to_strings() to extract meaningful content,
-    then batch writes to conversation table with incremental message IDs.
+    then batch writes to conversation table with incremental message IDs. Writes are
+    sent with BatchWriteItem in chunks of 25, in parallel when there is more than one chunk.
     
     Args:
         session_id (str): Session UUID for conversation grouping
@@ -211,7 +277,7 @@ def save_messages(session_id: str, message_uuid: str, starting_message_id: int,
     print("-"*40)
 
     # Use SSM config for table name
-    conversation_table = config.get("CONVERSATION_TABLE_NAME")
+    conversation_table = CONVERSATION_TABLE_NAME
     
     if not conversation_table:
         print(f"\n⚠️ CONFIGURATION WARNING")
@@ -221,24 +287,36 @@ def save_messages(session_id: str, message_uuid: str, starting_message_id: int,
         print("-"*40)
         return False
     
-    dynamodb = boto3.resource('dynamodb')
-    table = dynamodb.Table(conversation_table)
+    # Messages before starting_message_id were saved by earlier turns
+    put_requests = [
+        {
+            'PutRequest': {
+                'Item': {
+                    'session_id': {'S': session_id},
+                    'message_id': {'N': str(message_id)},
+                    'message_uuid': {'S': message_uuid},
+                    'message': {'S': message_text}
+                }
+            }
+        }
+        for message_id, message_text in enumerate(
+            messages_to_save[starting_message_id:], start=starting_message_id
+        )
+    ]
+
+    chunks = [
+        put_requests[i:i + BATCH_WRITE_SIZE]
+        for i in range(0, len(put_requests), BATCH_WRITE_SIZE)
+    ]
     
     try:
-        with table.batch_writer() as batch:
-            for i, message_text in enumerate(messages_to_save):
-                if i < starting_message_id:
-                    continue
-                message_id = starting_message_id
-                batch.put_item(
-                    Item={
-                        'session_id': session_id,
-                        'message_id': message_id,
-                        'message_uuid': message_uuid,
-                        'message': message_text
-                    }
-                )
-                starting_message_id += 1
+        if len(chunks) > 1:
+            # list() surfaces the first exception raised by any chunk
+            list(batch_write_executor.map(
+                lambda chunk: batch_write_chunk(conversation_table, chunk), chunks
+            ))
+        elif chunks:
+            batch_write_chunk(conversation_table, chunks[0])
         return True
     except Exception as e:
         print(f"\n❌ MESSAGE WRITE ERROR")
@@ -1,6 +1,12 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
 def load_file_content(file_path: str, default_content: str = None) -> str:
     """
     Load file content with optional fallback and comprehensive error handling.
+    Results are memoized per (file_path, default_content), since the files read
+    here ship with the image and do not change while the process runs.
     
     Args:
         file_path (str): Path to the file to read
@@ -16,21 +16,22 @@ Parameters:
 - LAST_NUMBER_OF_MESSAGES: Number of last messages to retrieve (default: 20)
 """
 
-import boto3
 import os
+from functools import lru_cache
 from botocore.exceptions import ClientError
+from .aws_clients import get_client
 
 # Project ID for SSM parameter path prefix
 PROJECT_ID = os.environ.get('PROJECT_ID', 'N/A')
 
 def get_ssm_client():
     """
-    Creates and returns an SSM client using default AWS configuration.
+    Returns the shared SSM client using default AWS configuration.
 
     Returns:
         boto3.client: SSM client
     """
-    return boto3.client("ssm")
+    return get_client("ssm")
 
 
 def get_ssm_parameter(param_name):
@@ -62,10 +63,14 @@ def get_ssm_parameter(param_name):
         raise
 
 
+@lru_cache(maxsize=1)
 def load_config():
     """
     Loads all required configuration parameters from SSM.
 
+    The result is cached, so every module that calls this at import shares one
+    set of SSM lookups. Treat the returned dictionary as read-only.
+
     Returns:
         dict: Configuration dictionary with all parameters
 
@@ -87,16 +92,39 @@ def load_config():
 
     config = {}
 
-    # Load each parameter
+    # Load every parameter with a single GetParameters call (up to 10 names per call)
+    full_param_names = {f"/{PROJECT_ID}/{key}": key for key in param_keys}
+    values = {}
+    error = None
+    try:
+        response = get_ssm_client().get_parameters(
+            Names=list(full_param_names), WithDecryption=True
+        )
+        for parameter in response["Parameters"]:
+            values[full_param_names[parameter["Name"]]] = parameter["Value"]
+        missing_params = response.get("InvalidParameters", [])
+    except ClientError as e:
+        missing_params = list(full_param_names)
+        error = e
+
+    if missing_params:
+        print("\n" + "=" * 70)
+        print("❌ SSM PARAMETER RETRIEVAL ERROR")
+        print("=" * 70)
+        print(f"📋 Parameters not found: {', '.join(missing_params)}")
+        if error is not None:
+            print(f"💥 Error: {error}")
+        print("=" * 70 + "\n")
+
     for key in param_keys:
-        try:
-            value = get_ssm_parameter(key)
+        if key in values:
+            value = values[key]
             # Convert to int for specific parameters
             if key in ["MAX_RESPONSE_SIZE_BYTES", "LAST_NUMBER_OF_MESSAGES"]:
                 config[key] = int(value)
             else:
                 config[key] = value
-        except ClientError:
+        else:
             # Set default values for optional parameters
             if key == "MAX_RESPONSE_SIZE_BYTES":
                 config[key] = 25600